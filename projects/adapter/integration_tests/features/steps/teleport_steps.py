@@ -0,0 +1,49 @@
+from behave import *
+
+import tempfile
+from types import SimpleNamespace
+
+
+@given("a local teleport storage with {compression} compression")
+def set_local_teleport(context, compression: str):
+    from dbt.adapters.fal_experimental.connections import (
+        TeleportCredentials,
+        TeleportTypeEnum,
+    )
+    from dbt.fal.adapters.teleport.info import LocalTeleportInfo
+
+    context.teleport_dir = tempfile.TemporaryDirectory()
+    credentials = TeleportCredentials(
+        type=TeleportTypeEnum.LOCAL,
+        local_path=context.teleport_dir.name,
+        compression=compression,
+    )
+    context.teleport_info = LocalTeleportInfo(
+        "parquet", credentials, context.teleport_dir.name
+    )
+    context.teleport_locations = {}
+
+
+@when("the following Python code is run with teleport")
+def run_with_teleport_step(context):
+    from dbt.adapters.fal_experimental.teleport import run_with_teleport
+
+    # Only the project root is needed to resolve the fal scripts path
+    config = SimpleNamespace(project_root=context.teleport_dir.name)
+    run_with_teleport(
+        context.text, context.teleport_info, context.teleport_locations, config
+    )
+
+
+@then("teleport relation {relation} is stored with {compression} compression")
+def check_teleport_compression(context, relation: str, compression: str):
+    import pyarrow.parquet as pq
+
+    relation_path = context.teleport_locations[relation]
+    metadata = pq.read_metadata(context.teleport_info.build_url(relation_path))
+    codecs = {
+        metadata.row_group(i).column(j).compression
+        for i in range(metadata.num_row_groups)
+        for j in range(metadata.num_columns)
+    }
+    assert codecs == {compression.upper()}, f"Expected {compression}, got {codecs}"
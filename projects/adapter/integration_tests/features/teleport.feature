@@ -0,0 +1,14 @@
+# Teleport is only implemented for duckdb and snowflake, run with -D profile=duckdb
+@teleport @TODO-postgres
+Feature: Python models with teleport
+  Background: Project Setup
+    Given the project teleport_project
+
+  Scenario: Run a Python model that modifies a teleported relation in place
+    When the following shell command is invoked:
+      """
+      dbt run --profiles-dir $profilesDir --project-dir $baseDir
+      """
+    Then there should be no errors
+    And the following models are calculated in order:
+      | model_a | model_b |
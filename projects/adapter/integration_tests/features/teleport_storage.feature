@@ -0,0 +1,25 @@
+@teleport
+Feature: Teleport storage
+  Scenario: Teleported relations can be read, modified in place and written back
+    Given a local teleport storage with gzip compression
+    When the following Python code is run with teleport:
+      """
+      import pandas as pd
+
+      def main(read_df, write_df):
+          data = pd.DataFrame({"my_int": [1, 2], "my_text": ["a", "b"]})
+          write_df("db.schema.model_a", data)
+
+          df = read_df("db.schema.model_a")
+          assert df.equals(data), df
+
+          # Frames read through teleport must be writable in place
+          df.loc[0, "my_int"] = 10
+          df.iloc[1, 0] = 20
+          write_df("db.schema.model_b", df)
+
+          result = read_df("db.schema.model_b")
+          assert result["my_int"].tolist() == [10, 20], result
+          assert result["my_text"].tolist() == ["a", "b"], result
+      """
+    Then teleport relation db.schema.model_b is stored with gzip compression
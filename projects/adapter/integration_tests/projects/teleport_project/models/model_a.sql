@@ -0,0 +1,11 @@
+{{ config(materialized='table') }}
+WITH data AS (
+
+    SELECT
+        1 AS my_int,
+        1.5 AS my_float,
+        'some text' AS my_text
+)
+
+SELECT *
+FROM data
@@ -0,0 +1,10 @@
+def model(dbt, fal):
+    dbt.config(materialized="table")
+
+    df = dbt.ref("model_a")
+
+    # Frames read through teleport must be writable in place
+    df.loc[0, "my_int"] = 2
+    df.iloc[0, 1] = 2.5
+    df["my_text"] = df["my_text"].str.upper()
+    return df
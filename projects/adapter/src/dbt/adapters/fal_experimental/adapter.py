@@ -44,7 +44,8 @@ def _isolated_runner(
 ) -> Any:
     # This function can be run in an entirely separate
     # process or an environment, so we need to reconstruct
-    # the DB adapter solely from the config.
+    # the DB adapter solely from the config. The manifests are
+    # only read from, so they are passed as is (never copied).
     adapter = reconstruct_adapter(flags, config, manifest, macro_manifest)
     return run_with_adapter(code, adapter, config)
 
@@ -3,6 +3,7 @@ from typing import Optional
 import os
 
 from dbt.adapters.contracts.connection import Credentials
+from dbt.exceptions import DbtRuntimeError
 from dbt_common.dataclass_schema import StrEnum, ExtensibleDbtClassMixin
 
 from dbt.fal.adapters.python import PythonConnectionManager
@@ -14,6 +15,10 @@ DEFAULT_HOSTS = {
 }
 
 
+# Compression codecs that parquet files can be written with
+TELEPORT_COMPRESSIONS = ["none", "snappy", "gzip", "brotli", "lz4", "zstd"]
+
+
 class TeleportTypeEnum(StrEnum):
     LOCAL = "local"
     REMOTE_S3 = "s3"
@@ -32,6 +37,27 @@ class TeleportCredentials(ExtensibleDbtClassMixin):
     s3_access_key_id: Optional[str] = None
     s3_access_key: Optional[str] = None
 
+    # parquet
+    compression: str = "zstd"
+
+    def __post_init__(self):
+        # Fail when the profile is parsed, rather than after a model has
+        # already computed the data it wants to write.
+        self.compression = self.compression.lower()
+        if self.compression not in TELEPORT_COMPRESSIONS:
+            raise DbtRuntimeError(
+                f"Invalid teleport compression '{self.compression}'. "
+                f"Please choose from: {', '.join(TELEPORT_COMPRESSIONS)}."
+            )
+
+        import pyarrow as pa
+
+        if self.compression != "none" and not pa.Codec.is_available(self.compression):
+            raise DbtRuntimeError(
+                f"Teleport compression '{self.compression}' is not available "
+                "in the installed pyarrow build."
+            )
+
 
 class FalConnectionManager(PythonConnectionManager):
     TYPE = "fal_experimental"
@@ -25,6 +25,7 @@ from .teleport import DataLocation, run_in_environment_with_teleport, run_with_t
 from .adapter_support import reload_adapter_cache
 from .adapter import run_in_environment_with_adapter, run_with_adapter
 
+from .utils import cache_static
 from .utils.environments import fetch_environment, db_adapter_config
 
 
@@ -52,7 +53,10 @@ class FalAdapterMixin(TeleportAdapter, metaclass=AdapterMeta):
         return getattr(self.credentials, "teleport", None) is not None
 
     @property
+    @cache_static
     def manifest(self) -> Manifest:
+        # Loading the full manifest is expensive and it doesn't change during
+        # a run, so it is loaded once and shared (read-only) by every model.
         return ManifestLoader.get_full_manifest(self.config)
 
     @property
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 import pandas as pd
-from typing import Any, Callable, Dict, NewType
+from typing import Any, Callable, Dict, NewType, Optional, Tuple
 
 from dbt.config.runtime import RuntimeConfig
 from dbt.adapters.contracts.connection import AdapterResponse
@@ -12,6 +12,7 @@ from dbt.adapters.fal_experimental.utils.environments import (
     EnvironmentDefinition,
 )
 from dbt.adapters.fal_experimental.utils import (
+    cache_static,
     extra_path,
     get_fal_scripts_path,
     retrieve_symbol,
@@ -40,10 +41,23 @@ def _teleport_df_from_external_storage(
         raise RuntimeError(f"Could not find url for '{relation}' in {locations}")
 
     if teleport_info.format == "parquet":
+        import pyarrow.parquet as pq
+
         relation_path = locations[relation]
         url = teleport_info.build_url(relation_path)
-        storage_options = _build_teleport_storage_options(teleport_info)
-        return pd.read_parquet(url, storage_options=storage_options)
+        filesystem, path = _build_teleport_filesystem(teleport_info, url)
+        # Pre-buffering coalesces the column chunks into a few large ranged
+        # reads that are issued concurrently, instead of a request per chunk.
+        with pq.ParquetFile(path, filesystem=filesystem, pre_buffer=True) as file:
+            table = file.read(use_threads=True, use_pandas_metadata=True)
+        # The file holds on to the pre-buffered bytes for as long as it is
+        # alive (even once closed), so drop it before converting the table.
+        del file
+        # Release the Arrow buffers as they are converted, so the table and the
+        # dataframe are not both held in memory. The columns are not split into
+        # zero-copy blocks: those are read-only, and models expect to be able
+        # to modify the dataframe in place.
+        return table.to_pandas(self_destruct=True, use_threads=True)
     else:
         # TODO: support more
         raise RuntimeError(f"Format {teleport_info.format} not supported")
@@ -56,31 +70,78 @@ def _teleport_df_to_external_storage(
     data: pd.DataFrame,
 ):
     if teleport_info.format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         relation_path = teleport_info.build_relation_path(relation)
         url = teleport_info.build_url(relation_path)
-        storage_options = _build_teleport_storage_options(teleport_info)
-
-        data.to_parquet(url, storage_options=storage_options)
+        filesystem, path = _build_teleport_filesystem(teleport_info, url)
+
+        # Numeric columns are wrapped without copying; convert the rest
+        # in parallel.
+        table = pa.Table.from_pandas(data, nthreads=pa.cpu_count())
+
+        # Row groups are kept large so the file is not fragmented, and carry
+        # statistics so that readers can skip the ones they don't need.
+        compression = teleport_info.credentials.compression
+        pq.write_table(
+            table,
+            path,
+            filesystem=filesystem,
+            compression=compression,
+            compression_level=3 if compression == "zstd" else None,
+            use_dictionary=True,
+            write_statistics=True,
+            data_page_size=1 << 20,
+            row_group_size=min(len(data), 1_000_000) or None,
+        )
         locations[relation] = relation_path
         return relation_path
     else:
         raise RuntimeError(f"Format {teleport_info.format} not supported")
 
 
-def _build_teleport_storage_options(teleport_info: TeleportInfo) -> Dict[str, str]:
-    storage_options = {}
-    if teleport_info.credentials.type == TeleportTypeEnum.REMOTE_S3:
-        storage_options = {
-            "key": teleport_info.credentials.s3_access_key_id,
-            "secret": teleport_info.credentials.s3_access_key,
-        }
-    elif teleport_info.credentials.type == TeleportTypeEnum.LOCAL:
-        pass
-    else:
-        raise RuntimeError(
-            f"Teleport storage type {teleport_info.credentials.type} not supported"
+def _build_teleport_filesystem(teleport_info: TeleportInfo, url: Any) -> Tuple[Any, str]:
+    """Build the pyarrow filesystem for the teleport storage, along with the
+    path of the given url inside it."""
+    from pyarrow import fs
+
+    credentials = teleport_info.credentials
+    if credentials.type == TeleportTypeEnum.REMOTE_S3:
+        filesystem = _get_s3_filesystem(
+            credentials.s3_bucket,
+            credentials.s3_region,
+            credentials.s3_access_key_id,
+            credentials.s3_access_key,
         )
-    return storage_options
+        return filesystem, str(url).removeprefix("s3://")
+    elif credentials.type == TeleportTypeEnum.LOCAL:
+        return fs.LocalFileSystem(), str(url)
+    else:
+        raise RuntimeError(f"Teleport storage type {credentials.type} not supported")
+
+
+@cache_static
+def _get_s3_filesystem(
+    bucket: str,
+    region: Optional[str],
+    access_key_id: Optional[str],
+    access_key: Optional[str],
+) -> Any:
+    """Return the S3 filesystem for the given credentials. It is shared by
+    every read and write, so that they reuse the same client (and its
+    connections) instead of setting up a new one each time."""
+    from pyarrow import fs
+
+    # Native (C++) S3 client, so reads and writes do not call back
+    # into Python for every block. Unlike s3fs, it does not look up
+    # the bucket's region by itself.
+    if not region:
+        region = fs.resolve_s3_region(bucket)
+
+    return fs.S3FileSystem(
+        access_key=access_key_id, secret_key=access_key, region=region
+    )
 
 
 def run_with_teleport(
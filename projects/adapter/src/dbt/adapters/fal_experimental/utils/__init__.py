@@ -1,4 +1,6 @@
+import hashlib
 from contextlib import contextmanager
+from types import CodeType
 from typing import Any
 
 from dbt.config.runtime import RuntimeConfig
@@ -14,10 +16,20 @@ def cache_static(func):
     return lru_cache(maxsize=None)(func)
 
 
+@cache_static
+def _compile_source(source_code: str) -> CodeType:
+    """Compile the source code once, naming it after its hash so that
+    tracebacks from different models can be told apart."""
+    digest = hashlib.blake2b(source_code.encode(), digest_size=16).hexdigest()
+    return compile(source_code, f"<fal:{digest}>", "exec")
+
+
 def retrieve_symbol(source_code: str, symbol_name: str) -> Any:
     """Retrieve the function with the given name from the source code."""
+    # Only the compilation is cached, every call still gets a fresh
+    # namespace so no module state leaks between runs.
     namespace = {}
-    exec(source_code, namespace)
+    exec(_compile_source(source_code), namespace)
     return namespace[symbol_name]
 
 
@@ -19,6 +19,13 @@ CONFIG_KEYS_TO_IGNORE = ["host", "remote_type", "type", "name", "machine_type"]
 
 logger = AdapterLogger("fal")
 
+# Parsed fal_project.yml files and the environments built from them, along
+# with the modification time of the file they were read at.
+_FAL_PROJECT_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_ENVIRONMENTS_CACHE: Dict[
+    Tuple[str, str], Tuple[int, Dict[str, EnvironmentDefinition]]
+] = {}
+
 
 class FalParseError(Exception):
     pass
@@ -30,13 +37,15 @@ class LocalConnection(EnvironmentConnection):
         return executable(*args, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalHost:
     """Local execution host - runs code in the current process."""
     pass
 
 
-@dataclass
+# Frozen, since the environments loaded from fal_project.yml are cached
+# and shared between models.
+@dataclass(frozen=True, slots=True)
 class EnvironmentDefinition:
     host: LocalHost
     kind: str
@@ -90,10 +99,21 @@ def load_environments(
     import os
 
     fal_project_path = os.path.join(base_dir, "fal_project.yml")
-    if not os.path.exists(fal_project_path):
-        raise FalParseError(f"{fal_project_path} must exist to define environments")
-
-    fal_project = load_yaml(fal_project_path)
+    try:
+        mtime = os.stat(fal_project_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FalParseError(
+            f"{fal_project_path} must exist to define environments"
+        ) from None
+
+    # Environments are loaded for every Python model, so reuse the previous
+    # result for as long as fal_project.yml is not modified.
+    cache_key = (fal_project_path, machine_type)
+    cached = _ENVIRONMENTS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    fal_project = _load_fal_project(fal_project_path, mtime)
     environments = {}
     for environment in fal_project.get("environments", []):
         env_name = _get_required_key(environment, "name")
@@ -103,16 +123,27 @@ def load_environments(
             )
 
         env_kind = _get_required_key(environment, "type")
-        if environments.get(env_name) is not None:
+        if env_name in environments:
             raise FalParseError("Environment names must be unique.")
 
         environments[env_name] = create_environment(
             env_name, env_kind, environment, machine_type, credentials
         )
 
+    _ENVIRONMENTS_CACHE[cache_key] = (mtime, environments)
     return environments
 
 
+def _load_fal_project(fal_project_path: str, mtime: int) -> Dict[str, Any]:
+    cached = _FAL_PROJECT_CACHE.get(fal_project_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    fal_project = load_yaml(fal_project_path)
+    _FAL_PROJECT_CACHE[fal_project_path] = (mtime, fal_project)
+    return fal_project
+
+
 def create_environment(
     name: str,
     kind: str,
@@ -144,11 +175,20 @@ def _is_local_environment(environment_name: str) -> bool:
 
 
 def _get_required_key(data: Dict[str, Any], name: str) -> Any:
-    if name not in data:
-        raise FalParseError("Missing required key: " + name)
-    return data[name]
+    try:
+        return data[name]
+    except KeyError:
+        raise FalParseError("Missing required key: " + name) from None
+
+
+@cache_static
+def _get_distribution(package: str) -> importlib_metadata.Distribution:
+    # Locating a distribution walks sys.path and parses its metadata files,
+    # so only do it once per package.
+    return importlib_metadata.distribution(package)
 
 
+@cache_static
 def _get_package_from_type(adapter_type: str):
     SPECIAL_ADAPTERS = {
         # Documented in https://docs.getdbt.com/docs/supported-data-platforms#community-adapters
@@ -157,27 +197,31 @@ def _get_package_from_type(adapter_type: str):
     return SPECIAL_ADAPTERS.get(adapter_type, f"dbt-{adapter_type}")
 
 
+@cache_static
 def _get_dbt_packages(
     adapter_type: str,
     is_teleport: bool = False,
     is_remote: bool = False,
-) -> Iterator[Tuple[str, Optional[str]]]:
+) -> Tuple[Tuple[str, Optional[str]], ...]:
+    # Resolving the packages requires reading the installed distributions'
+    # metadata, so the result is cached (as a tuple, since it is shared).
     dbt_adapter = _get_package_from_type(adapter_type)
+    packages = []
     for dbt_plugin_name in [dbt_adapter]:
-        distribution = importlib_metadata.distribution(dbt_plugin_name)
+        distribution = _get_distribution(dbt_plugin_name)
 
-        yield dbt_plugin_name, distribution.version
+        packages.append((dbt_plugin_name, distribution.version))
 
     try:
-        dbt_fal_version = importlib_metadata.version("dbt-postgres-python")
+        dbt_fal_version = _get_distribution("dbt-postgres-python").version
     except importlib_metadata.PackageNotFoundError:
         # It might not be installed.
-        return None
+        return tuple(packages)
 
     dbt_fal_dep = "dbt-postgres-python"
-    dbt_fal_extras = _find_adapter_extras(dbt_fal_dep, dbt_adapter)
+    dbt_fal_extras = _find_adapter_extras(dbt_adapter)
     if is_teleport:
-        dbt_fal_extras.add("teleport")
+        dbt_fal_extras = dbt_fal_extras | {"teleport"}
     dbt_fal_suffix = ""
 
     if _version_is_prerelease(dbt_fal_version):
@@ -188,29 +232,37 @@ def _get_dbt_packages(
             dbt_fal_version = None
 
     dbt_fal = f"{dbt_fal_dep}[{' ,'.join(dbt_fal_extras)}]{dbt_fal_suffix}"
-    yield dbt_fal, dbt_fal_version
+    packages.append((dbt_fal, dbt_fal_version))
+    return tuple(packages)
 
 
-def _find_adapter_extras(package: str, plugin_package: str) -> set[str]:
-    import pkgutil
-    import dbt.adapters
+@cache_static
+def _get_dbt_fal_extras() -> frozenset[str]:
+    # The extras are fixed at install time. Resolved lazily (rather than at
+    # import time) to keep importing the adapter free of side effects.
+    try:
+        return frozenset(_get_extras("dbt-postgres-python"))
+    except importlib_metadata.PackageNotFoundError:
+        return frozenset()
 
-    all_extras = _get_extras(package)
-    available_plugins = {
-        module_info.name
-        for module_info in pkgutil.iter_modules(dbt.adapters.__path__)
-        if module_info.ispkg and module_info.name in plugin_package
-    }
-    return available_plugins.intersection(all_extras)
 
+@cache_static
+def _find_adapter_extras(plugin_package: str) -> frozenset[str]:
+    # The adapter's distribution has already been resolved by the caller, so
+    # matching the extras against its name is enough (no need to scan the
+    # dbt.adapters namespace on disk).
+    return frozenset(
+        extra for extra in _get_dbt_fal_extras() if extra in plugin_package
+    )
 
-def _get_extras(package: str) -> list[str]:
-    import importlib_metadata
 
-    dist = importlib_metadata.distribution(package)
-    return dist.metadata.get_all("Provides-Extra", [])
+@cache_static
+def _get_extras(package: str) -> Tuple[str, ...]:
+    dist = _get_distribution(package)
+    return tuple(dist.metadata.get_all("Provides-Extra", []))
 
 
+@cache_static
 def _version_is_prerelease(raw_version: str) -> bool:
     from packaging.version import Version
 
@@ -218,17 +270,19 @@ def _version_is_prerelease(raw_version: str) -> bool:
     return package_version.is_prerelease
 
 
-def _get_project_root_path(package: str) -> Path:
+@cache_static
+def _get_project_root_path(package: str) -> Optional[Path]:
     from dbt.adapters import fal
 
     # If this is a development version, we'll install
-    # the current fal itself.
+    # the current fal itself. The walk is bounded by the
+    # filesystem root, in case we are not inside a checkout.
     path = Path(fal.__file__)
-    while path is not None:
-        if (path.parent / ".git").exists():
-            break
-        path = path.parent
-    return path / package
+    for parent in path.parents:
+        if (parent / ".git").exists():
+            return path / package
+        path = parent
+    return None
 
 
 def get_default_requirements(